@@ -5,15 +5,31 @@
 """Build script: renders Mermaid diagrams and converts Markdown to documents."""
 
 import argparse
+import atexit
+import base64
+import functools
+import hashlib
+import io
+import json
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import mermaid as md
-from mermaid.graph import Graph
+# mermaid-py is only the fallback renderer (it calls the mermaid.ink web
+# service); a local mermaid-cli install is preferred and needs no import.
+try:
+    import mermaid as md
+    from mermaid.graph import Graph
+except ImportError:
+    md = None
 
 PROJECT_DIR = Path(__file__).parent
 DIAGRAMS_SRC = PROJECT_DIR / "src" / "diagrams"
@@ -22,6 +38,8 @@ TEMPLATES_DIR = PROJECT_DIR / "templates"
 FILTERS_DIR = PROJECT_DIR / "filters"
 SRC_DIR = PROJECT_DIR / "src"
 BUILD_DIR = PROJECT_DIR / "build"
+CACHE_DIR = BUILD_DIR / ".cache"
+VALIDATED_CACHE = BUILD_DIR / ".validated.json"
 
 PDF_ENGINES = ["xelatex", "pdflatex", "typst", "weasyprint"]
 FORMATS = ["docx", "pdf", "html"]
@@ -49,6 +67,11 @@ def parse_args():
         default=None,
         help="Build a single source file (e.g. budget-process or budget-process.md).",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Combine all sources into one pandoc run per format (single output file).",
+    )
     parser.add_argument(
         "--check",
         action="store_true",
@@ -67,10 +90,35 @@ def parse_args():
 # ---------------------------------------------------------------------------
 
 def detect_tools():
-    """Check which external tools are available on PATH."""
-    tools = {}
-    for name in ["pandoc"] + PDF_ENGINES:
-        tools[name] = shutil.which(name)
+    """Check which external tools are available on PATH.
+
+    Scans each PATH directory once and probes every tool name against the
+    listing, instead of letting shutil.which stat every candidate in every
+    directory per tool.
+    """
+    names = ["pandoc", "mmdc"] + PDF_ENGINES
+    exts = (os.environ.get("PATHEXT", "").split(os.pathsep)
+            if os.name == "nt" else [""])
+    tools = dict.fromkeys(names)
+    for dir_str in os.environ.get("PATH", "").split(os.pathsep):
+        if not dir_str:
+            continue
+        try:
+            # normcase both sides: PATHEXT entries are conventionally
+            # uppercase (.EXE) while files on disk are pandoc.exe, and
+            # Windows resolves them case-insensitively.
+            entries = {os.path.normcase(e.name) for e in os.scandir(dir_str)}
+        except OSError:
+            continue
+        for name in names:
+            if tools[name]:
+                continue  # earlier PATH entries take precedence
+            for ext in exts:
+                candidate = os.path.join(dir_str, name + ext)
+                if (os.path.normcase(name + ext) in entries
+                        and os.access(candidate, os.X_OK)):
+                    tools[name] = candidate
+                    break
     return tools
 
 
@@ -96,15 +144,23 @@ def resolve_pdf_engine(tools, override=None):
     return engine
 
 
+@functools.lru_cache(maxsize=1)
 def get_pandoc_version():
-    """Return pandoc version string, or None if not available."""
+    """Return pandoc version string, or None if not available.
+
+    Cached so the tool check and every cache-key computation share a single
+    fork/exec — each pandoc startup costs tens of milliseconds of runtime
+    initialization.
+    """
     try:
         result = subprocess.run(
-            ["pandoc", "--version"], capture_output=True, text=True
+            ["pandoc", "--version"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, timeout=5,
         )
         if result.returncode == 0:
             return result.stdout.splitlines()[0].split()[-1]
-    except FileNotFoundError:
+    except (FileNotFoundError, subprocess.TimeoutExpired):
         pass
     return None
 
@@ -122,6 +178,9 @@ def run_check(tools):
     pandoc_label = f"{tools['pandoc']} ({pandoc_ver})" if pandoc_ver else "not found"
     print(f"\n  pandoc ............ {pandoc_label}")
 
+    mmdc_label = tools["mmdc"] or "not found (will fall back to mermaid-py)"
+    print(f"  mermaid-cli ....... {mmdc_label}")
+
     try:
         import mermaid  # noqa: F401
         print("  mermaid-py ........ OK")
@@ -148,18 +207,21 @@ def run_check(tools):
         else:
             print(f"  {fmt:16s} NO (pandoc not found)")
 
-    md_files = sorted(SRC_DIR.glob("*.md"))
-    mmd_files = sorted(DIAGRAMS_SRC.glob("*.mmd"))
+    md_files = _list(SRC_DIR, ".md")
+    mmd_files = _list(DIAGRAMS_SRC, ".mmd")
+
+    # One string prefix strip per entry beats a PurePath walk + allocation.
+    proj_prefix = str(PROJECT_DIR) + os.sep
 
     if md_files:
         print(f"\nSource files ({len(md_files)}):")
         for f in md_files:
-            print(f"  {f.relative_to(PROJECT_DIR)}")
+            print(f"  {str(f).removeprefix(proj_prefix)}")
 
     if mmd_files:
         print(f"\nDiagram sources ({len(mmd_files)}):")
         for f in mmd_files:
-            print(f"  {f.relative_to(PROJECT_DIR)}")
+            print(f"  {str(f).removeprefix(proj_prefix)}")
 
     print()
 
@@ -181,10 +243,26 @@ def run_clean():
 # Source file resolution
 # ---------------------------------------------------------------------------
 
+def _list(directory, suffix):
+    """Sorted files in directory with the given suffix, via one scandir.
+
+    DirEntry caches its type from the directory read, so this skips the
+    per-entry stat that Path.glob pays.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return sorted(
+                (Path(e.path) for e in it if e.is_file() and e.name.endswith(suffix)),
+                key=lambda p: p.name,
+            )
+    except OSError:
+        return []
+
+
 def resolve_source_files(file_arg):
     """Return list of source .md files to build."""
     if file_arg is None:
-        files = sorted(SRC_DIR.glob("*.md"))
+        files = _list(SRC_DIR, ".md")
         if not files:
             print("ERROR: No .md files found in src/")
             sys.exit(1)
@@ -209,7 +287,7 @@ def resolve_source_files(file_arg):
 
     print(f"ERROR: Source file not found: {file_arg}")
     print(f"  Looked in: {SRC_DIR}")
-    available = sorted(SRC_DIR.glob("*.md"))
+    available = _list(SRC_DIR, ".md")
     if available:
         print("  Available files:")
         for f in available:
@@ -221,32 +299,132 @@ def resolve_source_files(file_arg):
 # Diagram rendering
 # ---------------------------------------------------------------------------
 
-def render_diagrams():
-    """Render all .mmd files to PNG using mermaid-py."""
+def _pool_mermaid_session():
+    """Route mermaid-py's HTTP calls through one pooled requests.Session.
+
+    mermaid-py opens a fresh HTTPS connection to mermaid.ink per render; a
+    shared session keeps connections (and their TLS handshakes) alive across
+    the parallel renders and retries transient failures. Best-effort: the
+    default transport stays in place if mermaid-py's internals have moved.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter, Retry
+    except ImportError:
+        return
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    for mod_name in ("mermaid", "mermaid.graph"):
+        mod = sys.modules.get(mod_name)
+        if mod is not None and hasattr(mod, "requests"):
+            mod.requests = session
+
+
+def _render_mmd(mmd_file, out_path, mmdc_path, log):
+    """Render one Mermaid source file to out_path. Returns False on error.
+
+    Uses local mermaid-cli when available (no network round trip per
+    diagram); otherwise falls back to mermaid-py, which posts each diagram
+    to the mermaid.ink web service.
+    """
+    if mmdc_path:
+        result = subprocess.run(
+            [mmdc_path, "-i", str(mmd_file), "-o", str(out_path), "--quiet"],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            log.write(f"    ERROR: mmdc failed:\n{result.stderr}\n")
+            return False
+    else:
+        graph = Graph(mmd_file.stem, mmd_file.read_text())
+        render = md.Mermaid(graph)
+        if out_path.suffix == ".svg":
+            render.to_svg(str(out_path))
+        else:
+            render.to_png(str(out_path))
+    return True
+
+
+def render_diagrams(tools, formats):
+    """Render all .mmd files, in parallel across diagrams.
+
+    Every diagram gets an SVG (HTML embeds it directly — sharper and
+    smaller than a raster); a PNG is only rendered as well when a format
+    that needs raster images (pdf, docx) was requested.
+    """
     DIAGRAMS_OUT.mkdir(parents=True, exist_ok=True)
-    mmd_files = sorted(DIAGRAMS_SRC.glob("*.mmd"))
+    mmd_files = _list(DIAGRAMS_SRC, ".mmd")
 
     if not mmd_files:
         print("  No .mmd files found in src/diagrams/")
         return []
 
-    rendered = []
-    for mmd_file in mmd_files:
-        source = mmd_file.read_text()
-        out_path = DIAGRAMS_OUT / mmd_file.with_suffix(".png").name
-        print(f"  Rendering {mmd_file.name} -> {out_path.name} ...")
-
-        graph = Graph(mmd_file.stem, source)
-        result = md.Mermaid(graph)
-        result.to_png(str(out_path))
-
-        if out_path.exists():
-            size_kb = out_path.stat().st_size / 1024
-            print(f"    OK ({size_kb:.1f} KB)")
-            rendered.append(out_path)
-        else:
-            print(f"    WARNING: {out_path.name} was not created")
+    if not tools.get("mmdc"):
+        if md is None:
+            print("ERROR: No Mermaid renderer found. Install mermaid-cli "
+                  "(mmdc) or mermaid-py.")
+            sys.exit(1)
+        _pool_mermaid_session()
+
+    # Renderer identity is part of the skip key, so switching between mmdc
+    # and mermaid-py (or upgrading either) invalidates stale outputs.
+    renderer = tools.get("mmdc") or f"mermaid-py {getattr(md, '__version__', '')}"
+
+    suffixes = [".svg"]
+    if any(fmt in ("pdf", "docx") for fmt in formats):
+        suffixes.append(".png")
+
+    def _render_one(mmd_file):
+        """Render one diagram's outputs, buffering the log so parallel
+        output stays coherent. Returns (list of produced paths or None, log)."""
+        log = io.StringIO()
+        digest = hashlib.blake2b(
+            mmd_file.read_bytes() + b"\0" + renderer.encode(), digest_size=16
+        ).hexdigest()
+
+        produced = []
+        for suffix in suffixes:
+            out_path = DIAGRAMS_OUT / mmd_file.with_suffix(suffix).name
+            log.write(f"  Rendering {mmd_file.name} -> {out_path.name} ...\n")
+
+            sidecar = DIAGRAMS_OUT / (out_path.name + ".hash")
+            if (out_path.exists() and sidecar.exists()
+                    and sidecar.read_text() == digest):
+                size_kb = out_path.stat().st_size / 1024
+                log.write(f"    OK (unchanged, {size_kb:.1f} KB)\n")
+                produced.append(out_path)
+                continue
+
+            if not _render_mmd(mmd_file, out_path, tools.get("mmdc"), log):
+                return None, log.getvalue()
+
+            if out_path.exists():
+                sidecar.write_text(digest)
+                size_kb = out_path.stat().st_size / 1024
+                log.write(f"    OK ({size_kb:.1f} KB)\n")
+                produced.append(out_path)
+            else:
+                log.write(f"    WARNING: {out_path.name} was not created\n")
+
+        return produced or None, log.getvalue()
 
+    # Rendering is I/O-bound (a subprocess or an HTTP request per diagram),
+    # so a thread pool gives near-linear speedup in the diagram count.
+    rendered = []
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(8, len(mmd_files))) as ex:
+        for out_paths, log in ex.map(_render_one, mmd_files):
+            print(log, end="")
+            if out_paths:
+                rendered.extend(out_paths)
+            elif "ERROR" in log:
+                failed = True
+
+    if failed:
+        sys.exit(1)
     return rendered
 
 
@@ -254,35 +432,82 @@ def render_diagrams():
 # Validation
 # ---------------------------------------------------------------------------
 
+# Compiled once at import: these run per line of every source file, and
+# pre-compiling avoids a regex-cache probe on each call.
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+?)(?:\s*#*\s*)?$')
+_LINK_RE = re.compile(r'\[([^\]]*)\]\(#([^)]+)\)')
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+_WIN_PATH_RE = re.compile(r'[A-Z]:\\[\w\\]')
+_WIN_PATH_FULL_RE = re.compile(r'[A-Z]:\\[^\s,)]+')
+_PUNCT_RE = re.compile(r'[^\w\s-]')
+_WS_RE = re.compile(r'\s+')
+
+# Deletes ASCII punctuation (everything but [a-z0-9_-] and whitespace) in a
+# single C-level pass; built once at import.
+_ANCHOR_TRANS = str.maketrans({
+    c: None for c in map(chr, range(128))
+    if c not in "abcdefghijklmnopqrstuvwxyz0123456789-_" and not c.isspace()
+})
+
+
 def heading_to_anchor(text):
     """Convert heading text to a pandoc-style anchor identifier."""
     anchor = text.lower()
-    anchor = re.sub(r'[^\w\s-]', '', anchor)  # remove punctuation except hyphens
+    if anchor.isascii():
+        # translate + split/join replaces two regex substitutions and
+        # collapses whitespace runs to hyphens without extra allocations.
+        return "-".join(anchor.translate(_ANCHOR_TRANS).split())
+    # Non-ASCII headings need Unicode-aware \w, so keep the regex path.
+    anchor = _PUNCT_RE.sub('', anchor)  # remove punctuation except hyphens
     anchor = anchor.strip()
-    anchor = re.sub(r'[\s]+', '-', anchor)     # spaces to hyphens
+    anchor = _WS_RE.sub('-', anchor)    # spaces to hyphens
     return anchor
 
 
-def validate_links(md_files):
-    """Check that all internal anchor links point to valid headings."""
+def _scan_md(content):
+    """Scan one source file's decoded content in a single pass, running every
+    validator regex per line instead of re-reading and re-splitting per check.
+
+    Returns (anchors, links, win_paths): heading anchors, internal links as
+    (line_num, target, link_text), and bare Windows paths outside code as
+    (line_num, path_text).
+    """
+    anchors = set()
+    links = []
+    win_paths = []
+    in_code_block = False
+    for line_num, line in enumerate(content.splitlines(), 1):
+        # Headings and internal links: [text](#anchor)
+        m = _HEADING_RE.match(line)
+        if m:
+            anchors.add(heading_to_anchor(m.group(2)))
+        for lm in _LINK_RE.finditer(line):
+            links.append((line_num, lm.group(2), lm.group(1)))
+
+        # Windows paths only count outside code blocks and inline code
+        if line.strip().startswith("```"):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+        stripped = _INLINE_CODE_RE.sub('', line)
+        for wm in _WIN_PATH_RE.finditer(stripped):
+            # Extract the full path for the message
+            path_match = _WIN_PATH_FULL_RE.search(stripped[wm.start():])
+            path_text = path_match.group(0) if path_match else wm.group(0)
+            win_paths.append((line_num, path_text))
+    return anchors, links, win_paths
+
+
+def validate_links(scans):
+    """Check that all internal anchor links point to valid headings.
+
+    scans maps each source file to its _scan_md result.
+    """
     errors = []
-    for md_file in md_files:
-        content = md_file.read_text(encoding="utf-8")
-
-        # Collect anchors from headings (lines starting with #)
-        anchors = set()
-        for line in content.splitlines():
-            m = re.match(r'^(#{1,6})\s+(.+?)(?:\s*#*\s*)?$', line)
-            if m:
-                anchors.add(heading_to_anchor(m.group(2)))
-
-        # Find all internal links: [text](#anchor)
-        for m in re.finditer(r'\[([^\]]*)\]\(#([^)]+)\)', content):
-            link_text, target = m.group(1), m.group(2)
+    for md_file, (anchors, links, _) in scans.items():
+        for line_num, target, link_text in links:
             if target not in anchors:
-                # Find line number
-                pos = m.start()
-                line_num = content[:pos].count('\n') + 1
                 errors.append((md_file.name, line_num, target, link_text))
 
     if errors:
@@ -293,25 +518,15 @@ def validate_links(md_files):
     return errors
 
 
-def validate_bare_paths(md_files):
-    """Check for Windows paths outside backticks/code blocks (breaks LaTeX)."""
+def validate_bare_paths(scans):
+    """Check for Windows paths outside backticks/code blocks (breaks LaTeX).
+
+    scans maps each source file to its _scan_md result.
+    """
     errors = []
-    for md_file in md_files:
-        content = md_file.read_text(encoding="utf-8")
-        in_code_block = False
-        for line_num, line in enumerate(content.splitlines(), 1):
-            if line.strip().startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-            # Remove inline code spans before checking
-            stripped = re.sub(r'`[^`]+`', '', line)
-            for m in re.finditer(r'[A-Z]:\\[\w\\]', stripped):
-                # Extract the full path for the message
-                path_match = re.search(r'[A-Z]:\\[^\s,)]+', stripped[m.start():])
-                path_text = path_match.group(0) if path_match else m.group(0)
-                errors.append((md_file.name, line_num, path_text))
+    for md_file, (_, _, win_paths) in scans.items():
+        for line_num, path_text in win_paths:
+            errors.append((md_file.name, line_num, path_text))
 
     if errors:
         print("\n  WARNING: bare Windows paths found (wrap in backticks):")
@@ -321,39 +536,252 @@ def validate_bare_paths(md_files):
     return errors
 
 
+def validate_sources(md_files, content_by_file):
+    """Run all validators, skipping files whose content is unchanged since
+    their last clean validation.
+
+    Validation is pure in the source bytes, so a content hash recorded in
+    build/.validated.json after an error-free run lets incremental builds
+    re-validate only the files that actually changed.
+    """
+    try:
+        validated = json.loads(VALIDATED_CACHE.read_text())
+    except (OSError, ValueError):
+        validated = {}
+
+    hashes = {
+        p: hashlib.blake2b(content_by_file[p].encode(), digest_size=16).hexdigest()
+        for p in md_files
+    }
+    to_scan = [p for p in md_files if validated.get(str(p)) != hashes[p]]
+    skipped = len(md_files) - len(to_scan)
+    if skipped:
+        print(f"  {skipped} file(s) unchanged since last clean validation, skipped")
+
+    scans = {p: _scan_md(content_by_file[p]) for p in to_scan}
+    link_errors = validate_links(scans)
+    path_errors = validate_bare_paths(scans)
+
+    # Only error-free files earn a cache entry; files with warnings get
+    # re-checked (and re-reported) on the next run.
+    failed_names = {e[0] for e in link_errors} | {e[0] for e in path_errors}
+    for p in to_scan:
+        if p.name in failed_names:
+            validated.pop(str(p), None)
+        else:
+            validated[str(p)] = hashes[p]
+    BUILD_DIR.mkdir(parents=True, exist_ok=True)
+    VALIDATED_CACHE.write_text(json.dumps(validated, indent=2))
+
+
 # ---------------------------------------------------------------------------
-# Document building
+# Pandoc server
 # ---------------------------------------------------------------------------
 
-def build_pandoc_cmd(md_file, fmt, pdf_engine=None):
-    """Assemble the pandoc command for a given format. Returns (cmd, out_file)."""
-    ext_map = {"docx": ".docx", "pdf": ".pdf", "html": ".html"}
-    out_file = BUILD_DIR / md_file.with_suffix(ext_map[fmt]).name
+_PANDOC_SERVER_PORT = 54321
+_pandoc_server = None
+
 
-    resource_path = os.pathsep.join([
-        str(PROJECT_DIR),
-        str(SRC_DIR),
-        str(SRC_DIR / "images"),
-        str(DIAGRAMS_OUT),
-    ])
+def start_pandoc_server():
+    """Start a persistent `pandoc server` process (pandoc 2.18+).
+
+    The server keeps the Haskell runtime, parsed templates, and loaded
+    writers warm across conversions, so repeated HTML builds skip the
+    per-invocation startup cost. Returns the base URL, or None when this
+    pandoc has no server mode (conversions then use one subprocess each).
+    """
+    global _pandoc_server
+    proc = subprocess.Popen(
+        ["pandoc", "server", f"--port={_PANDOC_SERVER_PORT}"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    atexit.register(proc.terminate)
+    url = f"http://127.0.0.1:{_PANDOC_SERVER_PORT}"
+    # Poll until it accepts requests; old pandoc exits immediately instead.
+    for _ in range(50):
+        if proc.poll() is not None:
+            return None
+        try:
+            with urllib.request.urlopen(url + "/version", timeout=1):
+                _pandoc_server = url
+                return url
+        except OSError:
+            time.sleep(0.1)
+    proc.terminate()
+    return None
+
+
+def _server_files():
+    """Resource files for a pandoc server request, as name -> base64 content.
+
+    The server converts inside pandoc's sandbox with no filesystem access,
+    so everything --embed-resources needs — the stylesheet, diagram
+    renders, screenshots — must travel with the request. Names mirror how
+    the sources reference them: bare for diagrams, images/ for screenshots.
+    """
+    files = {}
+
+    def _add(name, path):
+        files[name] = base64.b64encode(path.read_bytes()).decode()
+
+    css = TEMPLATES_DIR / "style.css"
+    if css.exists():
+        _add(css.name, css)
+    for p in _list(DIAGRAMS_OUT, ".svg") + _list(DIAGRAMS_OUT, ".png"):
+        _add(p.name, p)
+    images_dir = SRC_DIR / "images"
+    try:
+        with os.scandir(images_dir) as it:
+            for e in it:
+                if e.is_file():
+                    _add(f"images/{e.name}", Path(e.path))
+    except OSError:
+        pass
+    return files
+
+
+def _convert_via_server(md_file, out_file, server, log):
+    """Convert one Markdown file to standalone HTML via the pandoc server.
+
+    Returns True on success. Any failure returns False and the caller falls
+    back to a regular pandoc subprocess.
+    """
+    text = md_file.read_text(encoding="utf-8")
+    # The server cannot run local Lua filters, so apply the svg-diagrams.lua
+    # rewrite here: bare diagram references point at their SVG renders.
+    for svg in _list(DIAGRAMS_OUT, ".svg"):
+        text = text.replace(f"({svg.stem}.png)", f"({svg.stem}.svg)")
+    params = {
+        "text": text,
+        "from": _reader_for([md_file]),
+        "to": "html",
+        "standalone": True,
+        "number-sections": True,
+        "toc": True,
+        "toc-depth": 3,
+        "embed-resources": True,
+        "html-math-method": {
+            "method": "katex",
+            "url": "https://cdn.jsdelivr.net/npm/katex@0.16.21/dist/",
+        },
+        "files": _server_files(),
+        "variables": {"css": ["style.css"]},
+    }
+    req = urllib.request.Request(
+        server, data=json.dumps(params).encode(),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=120) as resp:
+            out_file.write_bytes(resp.read())
+    except (OSError, urllib.error.HTTPError) as exc:
+        log.write(f"    pandoc server failed ({exc}); falling back to subprocess\n")
+        return False
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Document building
+# ---------------------------------------------------------------------------
+
+# Immutable command fragments, stringified once at import instead of per
+# build_pandoc_cmd call.
+_EXT_MAP = {"docx": ".docx", "pdf": ".pdf", "html": ".html"}
+_RESOURCE_PATH = os.pathsep.join([
+    str(PROJECT_DIR),
+    str(SRC_DIR),
+    str(SRC_DIR / "images"),
+    str(DIAGRAMS_OUT),
+])
+_BASE_CMD = ["pandoc", f"--resource-path={_RESOURCE_PATH}", "--number-sections"]
+_TOC_FILTER = f"--lua-filter={FILTERS_DIR / 'toc.lua'}"
+_SVG_FILTER = f"--lua-filter={FILTERS_DIR / 'svg-diagrams.lua'}"
+_REF_DOC = f"--reference-doc={TEMPLATES_DIR / 'reference.docx'}"
+_CSS = f"--css={TEMPLATES_DIR / 'style.css'}"
+
+
+def _reader_for(md_files):
+    """Pick the pandoc reader for a set of Markdown inputs.
+
+    Pinned rather than trusting pandoc's default. The strict markdown
+    reader has a known exponential-time bug on large raw HTML blocks (a
+    150 KB <script> blob takes ~25 s vs sub-second under commonmark), so
+    big sources embedding <script> get commonmark_x.
+    """
+    for f in md_files:
+        if f.stat().st_size > 64 * 1024 and b"<script" in f.read_bytes():
+            return "commonmark_x"
+    return "markdown"
+
+
+def _to_ast(md_file):
+    """Emit pandoc's JSON AST for one source file.
+
+    Parsing the markdown once and handing the AST to each writer pass saves
+    one parse per additional requested format. Returns the AST path, or
+    None when pandoc could not emit it (callers then use the source as-is).
+    """
+    ast_path = BUILD_DIR / ".ast" / (md_file.stem + ".json")
+    ast_path.parent.mkdir(parents=True, exist_ok=True)
+    reader = _reader_for([md_file])
+
+    # Same sidecar scheme as diagram renders: reuse the AST already on disk
+    # when nothing that feeds the parse changed, so no-op rebuilds spawn no
+    # parse subprocesses at all.
+    digest = hashlib.blake2b(
+        md_file.read_bytes() + b"\0" + reader.encode() + b"\0"
+        + (get_pandoc_version() or "").encode(), digest_size=16,
+    ).hexdigest()
+    sidecar = ast_path.with_name(ast_path.name + ".hash")
+    if (ast_path.exists() and sidecar.exists()
+            and sidecar.read_text() == digest):
+        return ast_path
+
+    cmd = ["pandoc", str(md_file), "-f", reader,
+           "-t", "json", "-o", str(ast_path)]
+    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL)
+    if result.returncode != 0 or not ast_path.exists():
+        return None
+    sidecar.write_text(digest)
+    return ast_path
+
+
+def build_pandoc_cmd(md_files, fmt, pdf_engine=None, out_name=None):
+    """Assemble the pandoc command for a given format. Returns (cmd, out_file).
+
+    md_files may be a single path or a list; multi-input commands get
+    --file-scope so footnotes and links resolve per source file. Inputs may
+    also be pre-parsed JSON ASTs from _to_ast.
+    """
+    if isinstance(md_files, Path):
+        md_files = [md_files]
+    stem = out_name if out_name else md_files[0].stem
+    out_file = BUILD_DIR / (stem + _EXT_MAP[fmt])
 
     cmd = [
-        "pandoc", str(md_file),
+        *_BASE_CMD,
+        *[str(f) for f in md_files],
         "-o", str(out_file),
-        f"--resource-path={resource_path}",
-        "--number-sections",
     ]
+    if len(md_files) > 1:
+        cmd.append("--file-scope")
+
+    if all(f.suffix == ".json" for f in md_files):
+        cmd.extend(["-f", "json"])
+    else:
+        cmd.extend(["-f", _reader_for(md_files)])
 
     if fmt == "docx":
-        cmd.append(f"--lua-filter={FILTERS_DIR / 'toc.lua'}")
-        cmd.append(f"--reference-doc={TEMPLATES_DIR / 'reference.docx'}")
+        cmd.append(_TOC_FILTER)
+        cmd.append(_REF_DOC)
 
     elif fmt == "pdf":
         cmd.append(f"--pdf-engine={pdf_engine}")
         if pdf_engine == "weasyprint":
             cmd.append("--toc")
         else:
-            cmd.append(f"--lua-filter={FILTERS_DIR / 'toc.lua'}")
+            cmd.append(_TOC_FILTER)
         if pdf_engine in ("xelatex", "pdflatex"):
             cmd.extend([
                 "-V", "geometry:margin=1in",
@@ -365,32 +793,130 @@ def build_pandoc_cmd(md_file, fmt, pdf_engine=None):
     elif fmt == "html":
         cmd.extend(["--standalone", "--toc", "--toc-depth=3", "--embed-resources",
                      "--katex=https://cdn.jsdelivr.net/npm/katex@0.16.21/dist/",
-                     f"--css={TEMPLATES_DIR / 'style.css'}"])
+                     _CSS, _SVG_FILTER])
 
     return cmd, out_file
 
 
-def build_document(md_file, fmt, pdf_engine=None):
-    """Convert a single Markdown file to the given format using pandoc."""
-    cmd, out_file = build_pandoc_cmd(md_file, fmt, pdf_engine)
+def _cache_key(md_files, cmd):
+    """Content hash of everything that can change a pandoc output file."""
+    h = hashlib.blake2b(digest_size=16)
+    for md_file in md_files:
+        h.update(md_file.read_bytes())
+        h.update(b"\0")
+    h.update(repr(cmd).encode())
+    h.update((get_pandoc_version() or "").encode())
+    # Template and filter edits must invalidate cached outputs.
+    for dep in (TEMPLATES_DIR / "reference.docx", TEMPLATES_DIR / "style.css",
+                FILTERS_DIR / "toc.lua", FILTERS_DIR / "svg-diagrams.lua"):
+        if dep.exists():
+            h.update(f"{dep.name}:{dep.stat().st_mtime_ns}".encode())
+    # So do re-rendered diagrams and edited images, which pandoc embeds.
+    for img_dir in (DIAGRAMS_OUT, SRC_DIR / "images"):
+        if img_dir.is_dir():
+            for p in sorted(img_dir.iterdir()):
+                h.update(f"{p.name}:{p.stat().st_mtime_ns}".encode())
+    return h.hexdigest()
+
+
+def _run_pandoc(cmd, out_file, md_files, log, server=None):
+    """Run one pandoc command, serving from the output cache when possible.
+
+    When a pandoc server is up, single-file HTML conversions go through it
+    instead of a fresh subprocess. Returns out_file on success or None on
+    failure; progress goes to log.
+    """
+    key = _cache_key(md_files, cmd)
+    cached = CACHE_DIR / (key + out_file.suffix)
+    if cached.exists():
+        out_file.unlink(missing_ok=True)
+        try:
+            os.link(cached, out_file)
+        except OSError:
+            shutil.copy(cached, out_file)
+        size_kb = out_file.stat().st_size / 1024
+        log.write(f"    OK (cached, {size_kb:.1f} KB)\n")
+        return out_file
 
-    print(f"  {md_file.name} -> {out_file.name}")
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # out_file may be a hardlink to an older cache entry; converting in
+    # place would rewrite that shared inode and corrupt the entry. Unlink
+    # first so the conversion creates a fresh inode.
+    out_file.unlink(missing_ok=True)
+
+    used_server = (server and out_file.suffix == ".html" and len(md_files) == 1
+                   and _convert_via_server(md_files[0], out_file, server, log))
+    if not used_server:
+        # pandoc writes its output via -o, so stdout is just noise; stderr
+        # goes to a temp file rather than a pipe, so a warning-heavy run
+        # can't block the child on pipe backpressure or balloon the parent.
+        with tempfile.TemporaryFile() as errf:
+            result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=errf)
+            if errf.tell():
+                errf.seek(0)
+                stderr = errf.read().decode(errors="replace")
+            else:
+                stderr = ""
 
-    if result.returncode != 0:
-        print(f"    ERROR: pandoc failed:\n{result.stderr}")
-        sys.exit(1)
+        if result.returncode != 0:
+            log.write(f"    ERROR: pandoc failed:\n{stderr}\n")
+            return None
 
-    if result.stderr:
-        print(f"    pandoc warnings: {result.stderr}")
+        if stderr:
+            log.write(f"    pandoc warnings: {stderr}\n")
+
+    if not out_file.exists():
+        log.write(f"    ERROR: {out_file.name} was not created\n")
+        return None
+
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(out_file, cached)
+    except OSError:
+        shutil.copy(out_file, cached)
+    size_kb = out_file.stat().st_size / 1024
+    log.write(f"    OK ({size_kb:.1f} KB)\n")
+    return out_file
+
+
+def build_document(md_file, fmt, pdf_engine=None, source=None):
+    """Convert a single Markdown file to the given format using pandoc.
+
+    source, when given, is the file's pre-parsed JSON AST from _to_ast; the
+    writer pass then skips re-parsing the markdown. Cache keys stay tied to
+    md_file either way.
+
+    Returns (out_file, log). out_file is None if the conversion failed; log
+    holds the buffered per-file output so parallel builds print coherently.
+    """
+    cmd, out_file = build_pandoc_cmd(source or md_file, fmt, pdf_engine,
+                                     out_name=md_file.stem)
+
+    log = io.StringIO()
+    log.write(f"  {md_file.name} -> {out_file.name}\n")
+    server = _pandoc_server if fmt == "html" else None
+    out = _run_pandoc(cmd, out_file, [md_file], log, server=server)
+    return out, log.getvalue()
 
-    if out_file.exists():
-        size_kb = out_file.stat().st_size / 1024
-        print(f"    OK ({size_kb:.1f} KB)")
-        return out_file
-    else:
-        print(f"    ERROR: {out_file.name} was not created")
-        sys.exit(1)
+
+# Formats where a single multi-input pandoc run produces a usable combined
+# document. docx keeps per-file runs so each output matches its source.
+BATCH_FORMATS = ("html", "pdf")
+
+
+def build_documents_batched(md_files, fmt, pdf_engine=None):
+    """Convert all Markdown sources in one pandoc invocation for a format.
+
+    One process pays pandoc startup, template parsing, and Lua filter
+    compilation once instead of per file. Returns (out_file, log) like
+    build_document.
+    """
+    cmd, out_file = build_pandoc_cmd(md_files, fmt, pdf_engine, out_name="combined")
+
+    log = io.StringIO()
+    names = ", ".join(f.name for f in md_files)
+    log.write(f"  {names} -> {out_file.name}\n")
+    out = _run_pandoc(cmd, out_file, md_files, log)
+    return out, log.getvalue()
 
 
 # ---------------------------------------------------------------------------
@@ -437,8 +963,14 @@ def main():
     if args.pdf_engine and "pdf" not in formats:
         print("Note: --pdf-engine is ignored for non-PDF formats.")
 
-    # Resolve source files
+    # Resolve source files and read each one once; validators share the
+    # decoded content instead of re-reading from disk. The reads overlap in
+    # a thread pool so the kernel can coalesce and schedule them instead of
+    # paying a serial readahead stall per file.
     md_files = resolve_source_files(args.file)
+    with ThreadPoolExecutor(max_workers=min(8, len(md_files))) as ex:
+        content_by_file = dict(zip(
+            md_files, ex.map(lambda p: p.read_text(encoding="utf-8"), md_files)))
 
     # Build header
     format_label = ", ".join(f.upper() for f in formats)
@@ -448,17 +980,50 @@ def main():
 
     # Validate sources
     print("\nValidating sources...")
-    validate_links(md_files)
-    validate_bare_paths(md_files)
+    validate_sources(md_files, content_by_file)
 
     # Step 1: Diagrams
     total_steps = 1 + len(formats)
     step = 1
     print(f"\n[{step}/{total_steps}] Rendering Mermaid diagrams...")
-    rendered = render_diagrams()
-
-    # Build each format
+    rendered = render_diagrams(tools, formats)
+
+    # Build every (file, format) pair in parallel. Each pandoc invocation is
+    # an independent subprocess, so threads spend their time waiting and the
+    # speedup is bounded only by core count.
+    # A persistent pandoc server amortizes startup cost across the per-file
+    # HTML conversions; only worth spawning when there is more than one.
+    if "html" in formats and not args.batch and len(md_files) > 1:
+        start_pandoc_server()
+
+    # With several formats requested, parse each source once up front and
+    # feed the JSON AST to every writer pass instead of re-parsing per
+    # format. Files whose AST emit fails just build from markdown.
+    sources = {md_file: None for md_file in md_files}
+    if len(formats) > 1:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            sources = dict(zip(md_files, ex.map(_to_ast, md_files)))
+
+    # With --batch, formats that support multi-input get one combined run
+    # instead of one run per file (a None entry marks the batched task).
+    tasks = []
+    for fmt in formats:
+        if args.batch and fmt in BATCH_FORMATS and len(md_files) > 1:
+            tasks.append((None, fmt))
+        else:
+            tasks.extend((md_file, fmt) for md_file in md_files)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = [
+            ex.submit(build_documents_batched, md_files, fmt, pdf_engine)
+            if f is None
+            else ex.submit(build_document, f, fmt, pdf_engine, sources[f])
+            for f, fmt in tasks
+        ]
+    outputs = {task: fut.result() for task, fut in zip(tasks, futures)}
+
+    # Replay the buffered logs grouped by format so output stays coherent.
     results = {}
+    failed = False
     for fmt in formats:
         step += 1
         label = fmt.upper()
@@ -466,19 +1031,27 @@ def main():
             label += f" (via {pdf_engine})"
         print(f"\n[{step}/{total_steps}] Building {label}...")
         built = []
-        for md_file in md_files:
-            out = build_document(md_file, fmt, pdf_engine)
-            built.append(out)
+        for task in (t for t in tasks if t[1] == fmt):
+            out, log = outputs[task]
+            print(log, end="")
+            if out is None:
+                failed = True
+            else:
+                built.append(out)
         results[fmt] = built
 
+    if failed:
+        sys.exit(1)
+
     # Summary
     print("\n" + "=" * 60)
     print("Build complete!")
     print(f"  Diagrams rendered: {len(rendered)}")
+    proj_prefix = str(PROJECT_DIR) + os.sep
     for fmt, files in results.items():
         print(f"  {fmt.upper()} documents: {len(files)}")
         for f in files:
-            print(f"    - {f.relative_to(PROJECT_DIR)}")
+            print(f"    - {str(f).removeprefix(proj_prefix)}")
     print("=" * 60)
 
 
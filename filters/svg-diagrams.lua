@@ -0,0 +1,13 @@
+-- Lua filter: points diagram images at their SVG renders for HTML output.
+-- Diagrams are rendered to SVG first (sharper, smaller, no rasterization
+-- step) and only rasterized to PNG for formats that need it. Sources keep
+-- referencing the .png name; diagram references are the bare filenames
+-- resolved from build/diagrams/, while screenshots live under images/ and
+-- keep their PNGs.
+
+function Image(img)
+  if not img.src:match("/") and img.src:match("%.png$") then
+    img.src = img.src:gsub("%.png$", ".svg")
+  end
+  return img
+end